@@ -2,7 +2,7 @@
 """
 Crawler Lane - Advanced AI-Powered Web Crawler for Text Extraction and Content Analysis
 
-A sophisticated web crawler designed for AI text extraction, content analysis, 
+A sophisticated web crawler designed for AI text extraction, content analysis,
 and machine learning data preparation with intelligent filtering and visualization.
 
 Author: Mohmmed Eloustah
@@ -10,6 +10,8 @@ GitHub: https://github.com/mohmmedwee/Crawler-lane
 License: MIT
 """
 
+import logging
+
 __version__ = "1.0.0"
 __author__ = "Mohmmed Eloustah"
 __email__ = "mohmmed.eloustah@gmail.com"
@@ -17,32 +19,58 @@ __description__ = "Advanced AI-Powered Web Crawler for Text Extraction and Conte
 __url__ = "https://github.com/mohmmedwee/Crawler-lane"
 __license__ = "MIT"
 
-# Import core classes
-from .crawler import WebCrawler
-from .advanced_crawler import AdvancedWebCrawler
-from .smart_filter import SmartContentFilter, ContentFilter, ContentType, ContentQuality
-from .visualization_dashboard import DataVisualizationDashboard
+logger = logging.getLogger(__name__)
+
+# Map public names to their defining submodules; the heavy modules
+# (Selenium, BeautifulSoup, plotly) are only imported when a name is
+# first used, so `import crawler` costs metadata only (PEP 562)
+_LAZY_IMPORTS = {
+    'WebCrawler': 'crawler',
+    'AdvancedWebCrawler': 'advanced_crawler',
+    'SmartContentFilter': 'smart_filter',
+    'ContentFilter': 'smart_filter',
+    'ContentType': 'smart_filter',
+    'ContentQuality': 'smart_filter',
+    'DataVisualizationDashboard': 'visualization_dashboard',
+    'app': 'api',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    try:
+        module = import_module(f'.{module_name}', __name__)
+    except ImportError:
+        # Keep the old "Flask app if available" behavior
+        if name == 'app':
+            return None
+        raise
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
-# Import Flask app if available
-try:
-    from .api import app
-except ImportError:
-    app = None
 
 # Define what gets imported with "from crawler import *"
 __all__ = [
     # Core classes
     'WebCrawler',
-    'AdvancedWebCrawler', 
+    'AdvancedWebCrawler',
     'SmartContentFilter',
     'ContentFilter',
     'ContentType',
     'ContentQuality',
     'DataVisualizationDashboard',
-    
+
     # Flask app
     'app',
-    
+
     # Metadata
     '__version__',
     '__author__',
@@ -52,9 +80,6 @@ __all__ = [
     '__license__',
 ]
 
-# Package initialization message
-print(f"🤖 Crawler Lane v{__version__} loaded successfully!")
-print(f"👨‍💻 Developed by {__author__} from Amman, Jordan")
-print(f"🌐 GitHub: {__url__}")
-print(f"📄 License: {__license__}")
-print("🚀 Ready for web crawling and content analysis!") 
\ No newline at end of file
+# Package initialization message (debug-level so workers and test runs
+# don't pay for five prints per import)
+logger.debug("🤖 Crawler Lane v%s loaded (by %s, %s)", __version__, __author__, __url__)
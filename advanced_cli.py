@@ -5,12 +5,96 @@ Advanced CLI for the Advanced Web Crawler
 """
 
 import argparse
-import json
+import logging
 import sys
 import time
+from itertools import islice
+
+# Configure logging once at import; main() only adjusts the level
+if not logging.getLogger().handlers:
+    logging.basicConfig(format='%(asctime)s - %(levelname)s - %(message)s')
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ujson is a drop-in stdlib replacement (~3x faster) for when orjson
+# cannot be installed
+try:
+    import ujson as json
+except ImportError:
+    import json
+
 from advanced_crawler import AdvancedWebCrawler
 
 
+def dump_json_file(data, filename):
+    """Write data as indented JSON, using orjson for speed when available."""
+    if orjson is not None:
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def _text_only_page(page):
+    """Project a crawled page down to its text fields."""
+    detailed_text = page['detailed_text']
+    return {
+        'url': page['url'],
+        'title': page['title'],
+        'word_count': page['word_count'],
+        'text_content': page['text_content'],
+        'detailed_text': {
+            'headings': detailed_text['headings'],
+            'paragraphs': detailed_text['paragraphs'],
+            'lists': detailed_text['lists'],
+            'meta_data': detailed_text['meta_data']
+        }
+    }
+
+
+def dump_text_only_file(result, filename):
+    """Stream the text-only view of the crawl result to filename.
+
+    Pages are serialized one at a time, so no second copy of the crawl is
+    built in memory.
+    """
+    if orjson is not None:
+        with open(filename, 'wb') as f:
+            f.write(b'{"metadata":')
+            f.write(orjson.dumps(result['metadata']))
+            f.write(b',"statistics":')
+            f.write(orjson.dumps(result['statistics']))
+            f.write(b',"pages":[')
+            for i, page in enumerate(result['pages']):
+                if i:
+                    f.write(b',')
+                f.write(orjson.dumps(_text_only_page(page)))
+            f.write(b']}')
+    else:
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write('{"metadata":')
+            json.dump(result['metadata'], f, ensure_ascii=False)
+            f.write(',"statistics":')
+            json.dump(result['statistics'], f, ensure_ascii=False)
+            f.write(',"pages":[')
+            for i, page in enumerate(result['pages']):
+                if i:
+                    f.write(',')
+                json.dump(_text_only_page(page), f, ensure_ascii=False)
+            f.write(']}')
+
+
+def dumps_json(data):
+    """Serialize data to an indented JSON string, preferring orjson."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Advanced Web Crawler - Extract comprehensive content from entire websites",
@@ -41,15 +125,15 @@ Examples:
                        help='Pretty print the output')
     parser.add_argument('--verbose', '-v', action='store_true',
                        help='Verbose output with detailed logging')
+    parser.add_argument('--quiet', '-q', action='store_true',
+                       help='Suppress the summary output (useful for batch runs)')
     parser.add_argument('--summary-only', action='store_true',
                        help='Show only summary statistics')
     
     args = parser.parse_args()
     
     # Setup logging
-    if args.verbose:
-        import logging
-        logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    logging.getLogger().setLevel(logging.INFO if args.verbose else logging.WARNING)
     
     print("🌐 Advanced Web Crawler")
     print("=" * 50)
@@ -82,29 +166,30 @@ Examples:
         end_time = time.time()
         duration = end_time - start_time
         
-        # Show summary
-        stats = result['statistics']
-        print("\n" + "=" * 50)
-        print("📊 Crawling Summary")
-        print("=" * 50)
-        print(f"✅ Successfully crawled: {stats['total_pages']} pages")
-        print(f"📝 Total words extracted: {stats['total_words']:,}")
-        print(f"🔗 Total links found: {stats['total_links']}")
-        print(f"🖼️ Total images found: {stats['total_images']}")
-        print(f"⏱️ Time taken: {duration:.2f} seconds")
-        print(f"📈 Average words per page: {stats['total_words'] // stats['total_pages'] if stats['total_pages'] > 0 else 0}")
-        
-        # Show content summary
-        content_summary = result['content_summary']
-        if content_summary.get('most_common_headings'):
-            print(f"\n📋 Most common headings:")
-            for heading, count in list(content_summary['most_common_headings'].items())[:5]:
-                print(f"   • {heading}: {count} times")
-        
-        if content_summary.get('content_types'):
-            print(f"\n📄 Content types found:")
-            for content_type, count in content_summary['content_types'].items():
-                print(f"   • {content_type}: {count}")
+        # Show summary (skipped with --quiet so batch runs pay no format cost)
+        if not args.quiet:
+            stats = result['statistics']
+            print("\n" + "=" * 50)
+            print("📊 Crawling Summary")
+            print("=" * 50)
+            print(f"✅ Successfully crawled: {stats['total_pages']} pages")
+            print(f"📝 Total words extracted: {stats['total_words']:,}")
+            print(f"🔗 Total links found: {stats['total_links']}")
+            print(f"🖼️ Total images found: {stats['total_images']}")
+            print(f"⏱️ Time taken: {duration:.2f} seconds")
+            print(f"📈 Average words per page: {stats['total_words'] // stats['total_pages'] if stats['total_pages'] > 0 else 0}")
+
+            # Show content summary
+            content_summary = result['content_summary']
+            if content_summary.get('most_common_headings'):
+                print(f"\n📋 Most common headings:")
+                for heading, count in islice(content_summary['most_common_headings'].items(), 5):
+                    print(f"   • {heading}: {count} times")
+
+            if content_summary.get('content_types'):
+                print(f"\n📄 Content types found:")
+                for content_type, count in content_summary['content_types'].items():
+                    print(f"   • {content_type}: {count}")
         
         # Save results
         if args.output:
@@ -114,35 +199,12 @@ Examples:
             domain = result['metadata']['domain']
             filename = f"advanced_crawl_{domain}_{timestamp}.json"
         
-        # Filter content if requested
+        # Save to file, filtering to text-only content if requested
         if args.extract_only_text:
             print("\n🔍 Extracting only text content...")
-            filtered_result = {
-                'metadata': result['metadata'],
-                'statistics': result['statistics'],
-                'pages': []
-            }
-            
-            for page in result['pages']:
-                filtered_page = {
-                    'url': page['url'],
-                    'title': page['title'],
-                    'word_count': page['word_count'],
-                    'text_content': page['text_content'],
-                    'detailed_text': {
-                        'headings': page['detailed_text']['headings'],
-                        'paragraphs': page['detailed_text']['paragraphs'],
-                        'lists': page['detailed_text']['lists'],
-                        'meta_data': page['detailed_text']['meta_data']
-                    }
-                }
-                filtered_result['pages'].append(filtered_page)
-            
-            result = filtered_result
-        
-        # Save to file
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+            dump_text_only_file(result, filename)
+        else:
+            dump_json_file(result, filename)
         
         print(f"\n💾 Results saved to: {filename}")
         
@@ -152,20 +214,21 @@ Examples:
             print("📄 Sample Output")
             print("=" * 50)
             if args.summary_only:
-                print(json.dumps({
+                print(dumps_json({
                     'statistics': result['statistics'],
                     'content_summary': result.get('content_summary', {})
-                }, indent=2, ensure_ascii=False))
+                }))
             else:
                 # Show first page as sample
-                if result['pages']:
-                    sample_page = result['pages'][0]
-                    print(json.dumps({
+                if (pages := result.get('pages')):
+                    sample_page = pages[0]
+                    preview = sample_page['text_content'][:500]
+                    print(dumps_json({
                         'url': sample_page['url'],
                         'title': sample_page['title'],
                         'word_count': sample_page['word_count'],
-                        'text_preview': sample_page['text_content'][:500] + "..."
-                    }, indent=2, ensure_ascii=False))
+                        'text_preview': preview + "..."
+                    }))
         
         print(f"\n🎉 Advanced crawling completed successfully!")
         
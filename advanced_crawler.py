@@ -4,8 +4,43 @@
 Advanced Web Crawler with Multi-Page Support and Comprehensive Text Extraction
 """
 
+import asyncio
+import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+
+# The C-backed lxml parser is 5-10x faster than the pure-Python default;
+# fall back gracefully when it is not installed
+try:
+    import lxml  # noqa: F401
+    _SOUP_PARSER = 'lxml'
+except ImportError:
+    _SOUP_PARSER = 'html.parser'
+
+# Native lxml path: parsing plus extraction without allocating BS4 Tag
+# wrappers is substantially faster again than BS4-on-lxml
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_html = None
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from pybloom_live import BloomFilter
+except ImportError:
+    BloomFilter = None
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
@@ -19,45 +54,381 @@ import json
 import re
 import urllib.parse
 from typing import Dict, Any, List, Set, Optional
-from collections import defaultdict
+from collections import Counter, defaultdict, deque
 import logging
 from urllib.robotparser import RobotFileParser
 import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from smart_filter import SmartContentFilter, ContentFilter, ContentType
 
+# Parsed-URL cache: the same URLs are re-parsed many times per crawl
+# (normalization, domain checks, site-structure building), so memoizing
+# urlparse skips the split work on repeats
+_urlparse = lru_cache(maxsize=8192)(urllib.parse.urlparse)
+
+# Compiled once at import instead of per <script> tag
+_SCRIPT_URL_RE = re.compile(r'["\'](https?://[^"\']+)["\']')
+
+# Word counting without allocating a list of every token on the page
+_WORD_RE = re.compile(r'\S+')
+
+
+def _extract_text_content(soup: BeautifulSoup) -> Dict[str, Any]:
+    """Extract comprehensive text content from page."""
+    # Remove script and style elements
+    for script in soup(["script", "style", "nav", "footer", "header"]):
+        script.decompose()
+    
+    # Extract different types of text content
+    text_data = {
+        'headings': {},
+        'paragraphs': [],
+        'lists': [],
+        'tables': [],
+        'links': [],
+        'images': [],
+        'forms': [],
+        'buttons': [],
+        'meta_data': {},
+        'structured_data': {}
+    }
+    
+    # Extract headings
+    for i in range(1, 7):
+        headings = soup.find_all(f'h{i}')
+        text_data['headings'][f'h{i}'] = [h.get_text(strip=True) for h in headings if h.get_text(strip=True)]
+    
+    # Extract paragraphs
+    paragraphs = soup.find_all('p')
+    text_data['paragraphs'] = [p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True)]
+    
+    # Extract lists
+    lists = soup.find_all(['ul', 'ol'])
+    for lst in lists:
+        items = [li.get_text(strip=True) for li in lst.find_all('li') if li.get_text(strip=True)]
+        if items:
+            text_data['lists'].append({
+                'type': lst.name,
+                'items': items
+            })
+    
+    # Extract tables
+    tables = soup.find_all('table')
+    for table in tables:
+        table_data = []
+        rows = table.find_all('tr')
+        for row in rows:
+            cells = [cell.get_text(strip=True) for cell in row.find_all(['td', 'th']) if cell.get_text(strip=True)]
+            if cells:
+                table_data.append(cells)
+        if table_data:
+            text_data['tables'].append(table_data)
+    
+    # Extract links
+    links = soup.find_all('a', href=True)
+    for link in links:
+        text_data['links'].append({
+            'text': link.get_text(strip=True),
+            'href': link.get('href'),
+            'title': link.get('title', '')
+        })
+    
+    # Extract images
+    images = soup.find_all('img')
+    for img in images:
+        text_data['images'].append({
+            'src': img.get('src'),
+            'alt': img.get('alt', ''),
+            'title': img.get('title', '')
+        })
+    
+    # Extract forms
+    forms = soup.find_all('form')
+    for form in forms:
+        form_data = {
+            'action': form.get('action', ''),
+            'method': form.get('method', ''),
+            'inputs': []
+        }
+        inputs = form.find_all('input')
+        for inp in inputs:
+            form_data['inputs'].append({
+                'type': inp.get('type', ''),
+                'name': inp.get('name', ''),
+                'placeholder': inp.get('placeholder', '')
+            })
+        text_data['forms'].append(form_data)
+    
+    # Extract buttons
+    buttons = soup.find_all('button')
+    text_data['buttons'] = [btn.get_text(strip=True) for btn in buttons if btn.get_text(strip=True)]
+    
+    # Extract meta data
+    meta_tags = soup.find_all('meta')
+    for meta in meta_tags:
+        name = meta.get('name') or meta.get('property')
+        content = meta.get('content')
+        if name and content:
+            text_data['meta_data'][name] = content
+    
+    # Extract structured data (JSON-LD)
+    scripts = soup.find_all('script', type='application/ld+json')
+    for script in scripts:
+        try:
+            structured_data = json.loads(script.string)
+            text_data['structured_data'] = structured_data
+        except:
+            pass
+    
+    return text_data
+
+
+def _parse_soup(soup: BeautifulSoup) -> Dict[str, Any]:
+    """Stateless half of page parsing: everything derivable from the tree
+    alone, with link normalization and smart filtering left to the caller."""
+    text_data = _extract_text_content(soup)
+    all_text = soup.get_text(separator=' ', strip=True)
+    title = soup.find('title')
+    title_text = title.get_text() if title else "No title found"
+    hrefs = [link.get('href') for link in soup.find_all('a', href=True)]
+    script_urls = []
+    for script in soup.find_all('script'):
+        if script.string:
+            # Look for URLs in JavaScript
+            script_urls.extend(_SCRIPT_URL_RE.findall(script.string))
+    return {
+        'text_data': text_data,
+        'all_text': all_text,
+        'title': title_text,
+        'word_count': sum(1 for _ in _WORD_RE.finditer(all_text)),
+        'hrefs': hrefs,
+        'script_urls': script_urls,
+    }
+
+
+def _extract_text_content_lxml(tree) -> Dict[str, Any]:
+    """lxml twin of _extract_text_content, producing the same structure.
+
+    A single walk over the tree dispatches on tag instead of one full
+    traversal per element type.
+    """
+    # Remove script and style elements
+    etree.strip_elements(tree, 'script', 'style', 'nav', 'footer', 'header', with_tail=False)
+
+    text_data = {
+        'headings': {f'h{i}': [] for i in range(1, 7)},
+        'paragraphs': [],
+        'lists': [],
+        'tables': [],
+        'links': [],
+        'images': [],
+        'forms': [],
+        'buttons': [],
+        'meta_data': {},
+        'structured_data': {}
+    }
+    headings = text_data['headings']
+
+    for el in tree.iter():
+        tag = el.tag
+        if not isinstance(tag, str):
+            # Comments and processing instructions
+            continue
+
+        if tag in headings:
+            if (text := el.text_content().strip()):
+                headings[tag].append(text)
+        elif tag == 'p':
+            if (text := el.text_content().strip()):
+                text_data['paragraphs'].append(text)
+        elif tag in ('ul', 'ol'):
+            items = [text for li in el.iter('li') if (text := li.text_content().strip())]
+            if items:
+                text_data['lists'].append({
+                    'type': tag,
+                    'items': items
+                })
+        elif tag == 'table':
+            table_data = []
+            for row in el.iter('tr'):
+                cells = [text for cell in row.iter('td', 'th')
+                         if (text := cell.text_content().strip())]
+                if cells:
+                    table_data.append(cells)
+            if table_data:
+                text_data['tables'].append(table_data)
+        elif tag == 'a':
+            if el.get('href') is not None:
+                text_data['links'].append({
+                    'text': el.text_content().strip(),
+                    'href': el.get('href'),
+                    'title': el.get('title', '')
+                })
+        elif tag == 'img':
+            text_data['images'].append({
+                'src': el.get('src'),
+                'alt': el.get('alt', ''),
+                'title': el.get('title', '')
+            })
+        elif tag == 'form':
+            form_data = {
+                'action': el.get('action', ''),
+                'method': el.get('method', ''),
+                'inputs': []
+            }
+            for inp in el.iter('input'):
+                form_data['inputs'].append({
+                    'type': inp.get('type', ''),
+                    'name': inp.get('name', ''),
+                    'placeholder': inp.get('placeholder', '')
+                })
+            text_data['forms'].append(form_data)
+        elif tag == 'button':
+            if (text := el.text_content().strip()):
+                text_data['buttons'].append(text)
+        elif tag == 'meta':
+            name = el.get('name') or el.get('property')
+            content = el.get('content')
+            if name and content:
+                text_data['meta_data'][name] = content
+
+    return text_data
+
+
+def _parse_tree(tree) -> Dict[str, Any]:
+    """lxml twin of _parse_soup for raw lxml element trees."""
+    title_text = tree.findtext('.//title') or "No title found"
+    text_data = _extract_text_content_lxml(tree)
+    # Split per text node: text_content() would concatenate adjacent
+    # nodes with no separator, merging words across tags on minified
+    # HTML. The word list is reused for the count.
+    words = [word for text in tree.itertext() for word in text.split()]
+    all_text = ' '.join(words)
+    # Attribute-only XPath: the frontier needs just the href strings, so
+    # no element objects are materialized for this pass
+    hrefs = tree.xpath('//a[@href]/@href')
+    script_urls = []
+    for text in tree.xpath('//script/text()'):
+        # Look for URLs in JavaScript
+        script_urls.extend(_SCRIPT_URL_RE.findall(text))
+    return {
+        'text_data': text_data,
+        'all_text': all_text,
+        'title': title_text.strip() if title_text else "No title found",
+        'word_count': len(words),
+        'hrefs': hrefs,
+        'script_urls': script_urls,
+    }
+
+
+def _parse_html(content) -> Dict[str, Any]:
+    """Parse raw HTML (bytes or str) with the fastest available backend."""
+    if lxml_html is not None:
+        try:
+            return _parse_tree(lxml_html.fromstring(content))
+        except Exception:
+            # Malformed enough to trip lxml; BS4 is more forgiving
+            pass
+    return _parse_soup(BeautifulSoup(content, _SOUP_PARSER))
+
+
+def _parse_page_worker(html: bytes) -> Dict[str, Any]:
+    """Parse raw HTML bytes into plain extracted fields (runs in a worker
+    process, so only picklable dicts cross the boundary)."""
+    return _parse_html(html)
+
+
+class _HostRateLimiter:
+    """Minimal async token bucket: at most one request per `interval`
+    seconds per host, while requests to different hosts proceed
+    independently. Replaces the blanket time.sleep politeness delay."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next_at = defaultdict(float)
+        self._locks = defaultdict(asyncio.Lock)
+
+    async def wait(self, netloc: str):
+        if self.interval <= 0:
+            return
+        async with self._locks[netloc]:
+            now = time.monotonic()
+            wait_for = self._next_at[netloc] - now
+            if wait_for > 0:
+                await asyncio.sleep(wait_for)
+                now = time.monotonic()
+            self._next_at[netloc] = now + self.interval
+
+
+# Shared process pool so CPU-bound HTML parsing runs on all cores instead
+# of serializing behind the GIL; created on first use
+_PARSE_POOL = None
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    global _PARSE_POOL
+    if _PARSE_POOL is None:
+        _PARSE_POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _PARSE_POOL
+
 
 class AdvancedWebCrawler:
-    def __init__(self, max_pages: int = 100, max_depth: int = 3, delay: float = 1.0):
+    def __init__(self, max_pages: int = 100, max_depth: int = 3, delay: float = 1.0,
+                 session: requests.Session = None, respect_robots_txt: bool = False):
         """
         Initialize advanced crawler
-        
+
         Args:
             max_pages: Maximum number of pages to crawl
             max_depth: Maximum depth of crawling (how many links deep)
             delay: Delay between requests in seconds
+            session: Optional shared requests.Session to reuse pooled connections
+            respect_robots_txt: Honor robots.txt rules and Crawl-delay
         """
         self.max_pages = max_pages
         self.max_depth = max_depth
         self.delay = delay
+        self.respect_robots_txt = respect_robots_txt
+        # Bound per-page download size so one huge response can't stall the
+        # crawl or blow memory
+        self.max_body_bytes = 5 * 1024 * 1024
         self.ua = UserAgent()
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': self.ua.random,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        })
+        if session is not None:
+            self.session = session
+        else:
+            self.session = requests.Session()
+            # Size the connection pool for the crawl: the default adapter
+            # keeps only 10 sockets, so same-host fetches would re-handshake
+            adapter = HTTPAdapter(
+                pool_connections=32,
+                pool_maxsize=128,
+                max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+            )
+            self.session.mount('https://', adapter)
+            self.session.mount('http://', adapter)
+            self.session.headers.update({
+                'User-Agent': self.ua.random,
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+                'Accept-Language': 'en-US,en;q=0.5',
+                'Accept-Encoding': 'gzip, deflate',
+                'Connection': 'keep-alive',
+                'Upgrade-Insecure-Requests': '1',
+            })
         
         # Crawling state
+        self._driver = None
         self.crawled_urls = set()
-        self.url_queue = []
+        self.seen_bloom = self._new_bloom()
+        # deque: popleft is O(1) where list.pop(0) shifts every element
+        self.url_queue = deque()
+        self._queued = set()
         self.domain = None
         self.robot_parser = None
         
         # Data storage
         self.pages_data = []
+        self._stats = {'total_words': 0, 'total_links': 0, 'total_images': 0}
         self.site_map = defaultdict(list)
         self.text_data = {
             'total_pages': 0,
@@ -77,6 +448,60 @@ class AdvancedWebCrawler:
         # Initialize smart filter
         self.smart_filter = SmartContentFilter()
         
+    def reset_state(self):
+        """Clear per-crawl state so a pooled instance can be reused.
+
+        Fresh containers are assigned (not mutated) so reports returned by a
+        previous crawl stay valid.
+        """
+        self.crawled_urls = set()
+        self.seen_bloom = self._new_bloom()
+        self.url_queue = deque()
+        self._queued = set()
+        self.pages_data = []
+        self._stats = {'total_words': 0, 'total_links': 0, 'total_images': 0}
+        self.site_map = defaultdict(list)
+        self.domain = None
+        self.filter_config = None
+
+    def _new_bloom(self):
+        """Fresh Bloom filter for visited URLs, or None without pybloom-live."""
+        if BloomFilter is None:
+            return None
+        return BloomFilter(capacity=self.max_pages * 10, error_rate=0.001)
+
+    def _seen_url(self, url: str) -> bool:
+        """Two-stage visited check: the Bloom filter answers most misses in
+        a few bit probes; only a positive falls through to the exact set."""
+        if self.seen_bloom is not None and url not in self.seen_bloom:
+            return False
+        return url in self.crawled_urls
+
+    def _mark_crawled(self, url: str):
+        """Record url in the exact set and the Bloom first stage."""
+        self.crawled_urls.add(url)
+        if self.seen_bloom is not None:
+            self.seen_bloom.add(url)
+
+    def _record_page(self, page_data: Dict[str, Any]):
+        """Append a crawled page and fold it into the running statistics,
+        so generate_report needs no extra passes over pages_data."""
+        self.pages_data.append(page_data)
+        if self._stats is not None:
+            self._stats['total_words'] += page_data.get('word_count', 0)
+            self._stats['total_links'] += len(page_data.get('new_links', []))
+            self._stats['total_images'] += len(page_data.get('detailed_text', {}).get('images', []))
+
+    # Resolved chromedriver path shared across instances so the
+    # disk/network check in ChromeDriverManager runs once per process
+    _chromedriver_path = None
+
+    @classmethod
+    def _get_chromedriver_path(cls) -> str:
+        if cls._chromedriver_path is None:
+            cls._chromedriver_path = ChromeDriverManager().install()
+        return cls._chromedriver_path
+
     def setup_selenium_driver(self) -> webdriver.Chrome:
         """Setup Chrome driver with appropriate options for web scraping."""
         chrome_options = Options()
@@ -90,40 +515,82 @@ class AdvancedWebCrawler:
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
         
-        service = Service(ChromeDriverManager().install())
+        service = Service(self._get_chromedriver_path())
         driver = webdriver.Chrome(service=service, options=chrome_options)
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         return driver
-    
+
+    def _get_selenium_driver(self) -> webdriver.Chrome:
+        """Lazily boot one Chrome instance and reuse it across pages;
+        booting Chrome costs seconds per page otherwise."""
+        if self._driver is None:
+            self._driver = self.setup_selenium_driver()
+        return self._driver
+
+    def close(self):
+        """Release the shared Selenium driver, if one was started."""
+        if self._driver is not None:
+            try:
+                self._driver.quit()
+            except Exception:
+                pass
+            self._driver = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # robots.txt parse results shared across instances, keyed by origin;
+    # entries expire after an hour so long-lived pools pick up changes
+    _ROBOTS_CACHE = {}
+    _ROBOTS_TTL = 3600.0
+
     def check_robots_txt(self, base_url: str) -> bool:
         """Check robots.txt to see if crawling is allowed."""
-        # Temporarily bypass robots.txt check for testing
-        return True
-        
+        # Bypassed by default for testing; opt in via respect_robots_txt
+        if not self.respect_robots_txt:
+            return True
+
         try:
-            parsed_url = urllib.parse.urlparse(base_url)
-            robots_url = f"{parsed_url.scheme}://{parsed_url.netloc}/robots.txt"
+            parsed_url = _urlparse(base_url)
+            origin = f"{parsed_url.scheme}://{parsed_url.netloc}"
+            cached = self._ROBOTS_CACHE.get(origin)
+            if cached is not None and time.monotonic() - cached[1] < self._ROBOTS_TTL:
+                parser = cached[0]
+            else:
+                parser = RobotFileParser()
+                parser.set_url(f"{origin}/robots.txt")
+                parser.read()
+                self._ROBOTS_CACHE[origin] = (parser, time.monotonic())
+            self.robot_parser = parser
             
-            self.robot_parser = RobotFileParser()
-            self.robot_parser.set_url(robots_url)
-            self.robot_parser.read()
+            # Honor Crawl-delay when the site asks for a slower pace
+            crawl_delay = parser.crawl_delay("*")
+            if crawl_delay is not None:
+                self.delay = max(self.delay, float(crawl_delay))
             
-            return self.robot_parser.can_fetch("*", base_url)
+            return parser.can_fetch("*", base_url)
         except Exception as e:
             self.logger.warning(f"Could not check robots.txt: {e}")
             return True
     
     def normalize_url(self, url: str, base_url: str) -> str:
         """Normalize URL to avoid duplicates."""
+        # Cheap prefix test before any parsing: fragments and
+        # javascript:/mailto:/tel: links can never join the frontier
+        if not url or url.startswith(('#', 'javascript:', 'mailto:', 'tel:')):
+            return None
         try:
             # Parse URLs
-            parsed_base = urllib.parse.urlparse(base_url)
-            parsed_url = urllib.parse.urlparse(url)
+            parsed_base = _urlparse(base_url)
+            parsed_url = _urlparse(url)
             
             # Handle relative URLs
             if not parsed_url.netloc:
                 url = urllib.parse.urljoin(base_url, url)
-                parsed_url = urllib.parse.urlparse(url)
+                parsed_url = _urlparse(url)
             
             # Only crawl same domain
             if parsed_url.netloc != parsed_base.netloc:
@@ -146,112 +613,7 @@ class AdvancedWebCrawler:
     
     def extract_text_content(self, soup: BeautifulSoup) -> Dict[str, Any]:
         """Extract comprehensive text content from page."""
-        # Remove script and style elements
-        for script in soup(["script", "style", "nav", "footer", "header"]):
-            script.decompose()
-        
-        # Extract different types of text content
-        text_data = {
-            'headings': {},
-            'paragraphs': [],
-            'lists': [],
-            'tables': [],
-            'links': [],
-            'images': [],
-            'forms': [],
-            'buttons': [],
-            'meta_data': {},
-            'structured_data': {}
-        }
-        
-        # Extract headings
-        for i in range(1, 7):
-            headings = soup.find_all(f'h{i}')
-            text_data['headings'][f'h{i}'] = [h.get_text(strip=True) for h in headings if h.get_text(strip=True)]
-        
-        # Extract paragraphs
-        paragraphs = soup.find_all('p')
-        text_data['paragraphs'] = [p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True)]
-        
-        # Extract lists
-        lists = soup.find_all(['ul', 'ol'])
-        for lst in lists:
-            items = [li.get_text(strip=True) for li in lst.find_all('li') if li.get_text(strip=True)]
-            if items:
-                text_data['lists'].append({
-                    'type': lst.name,
-                    'items': items
-                })
-        
-        # Extract tables
-        tables = soup.find_all('table')
-        for table in tables:
-            table_data = []
-            rows = table.find_all('tr')
-            for row in rows:
-                cells = [cell.get_text(strip=True) for cell in row.find_all(['td', 'th']) if cell.get_text(strip=True)]
-                if cells:
-                    table_data.append(cells)
-            if table_data:
-                text_data['tables'].append(table_data)
-        
-        # Extract links
-        links = soup.find_all('a', href=True)
-        for link in links:
-            text_data['links'].append({
-                'text': link.get_text(strip=True),
-                'href': link.get('href'),
-                'title': link.get('title', '')
-            })
-        
-        # Extract images
-        images = soup.find_all('img')
-        for img in images:
-            text_data['images'].append({
-                'src': img.get('src'),
-                'alt': img.get('alt', ''),
-                'title': img.get('title', '')
-            })
-        
-        # Extract forms
-        forms = soup.find_all('form')
-        for form in forms:
-            form_data = {
-                'action': form.get('action', ''),
-                'method': form.get('method', ''),
-                'inputs': []
-            }
-            inputs = form.find_all('input')
-            for inp in inputs:
-                form_data['inputs'].append({
-                    'type': inp.get('type', ''),
-                    'name': inp.get('name', ''),
-                    'placeholder': inp.get('placeholder', '')
-                })
-            text_data['forms'].append(form_data)
-        
-        # Extract buttons
-        buttons = soup.find_all('button')
-        text_data['buttons'] = [btn.get_text(strip=True) for btn in buttons if btn.get_text(strip=True)]
-        
-        # Extract meta data
-        meta_tags = soup.find_all('meta')
-        for meta in meta_tags:
-            name = meta.get('name') or meta.get('property')
-            content = meta.get('content')
-            if name and content:
-                text_data['meta_data'][name] = content
-        
-        # Extract structured data (JSON-LD)
-        scripts = soup.find_all('script', type='application/ld+json')
-        for script in scripts:
-            try:
-                structured_data = json.loads(script.string)
-                text_data['structured_data'] = structured_data
-            except:
-                pass
-        
-        return text_data
+        return _extract_text_content(soup)
     
     def crawl_page(self, url: str, use_selenium: bool = False, mark_crawled: bool = True) -> Dict[str, Any]:
         """Crawl a single page and extract comprehensive data."""
@@ -275,61 +637,48 @@ class AdvancedWebCrawler:
                 'error': str(e)
             }
     
-    def _crawl_with_requests(self, url: str) -> Dict[str, Any]:
-        """Crawl page using requests."""
-        response = self.session.get(url, timeout=30)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Extract comprehensive text data
-        text_data = self.extract_text_content(soup)
-        
-        # Get all text content
-        all_text = soup.get_text(separator=' ', strip=True)
-        
-        # Extract title
-        title = soup.find('title')
-        title_text = title.get_text() if title else "No title found"
-        
-        # Count words
-        word_count = len(all_text.split())
-        
-        # Find new links
-        new_links = []
-        links = soup.find_all('a', href=True)
-        for link in links:
-            href = link.get('href')
+    def _build_page_data(self, url: str, soup: BeautifulSoup, method: str,
+                         status_code: int = None) -> Dict[str, Any]:
+        """Extract text data, links and content analysis from a parsed page."""
+        return self._finish_page_data(url, _parse_soup(soup), method, status_code=status_code)
+
+    def _finish_page_data(self, url: str, parsed: Dict[str, Any], method: str,
+                          status_code: int = None) -> Dict[str, Any]:
+        """Stateful half of page building: link normalization against the
+        visited set plus smart-filter analysis of pre-parsed fields."""
+        text_data = parsed['text_data']
+        all_text = parsed['all_text']
+        title_text = parsed['title']
+
+        # Find new links, collapsing intra-page duplicates as we go; dict
+        # keys give O(1) membership with first-seen order preserved
+        new_links = {}
+        for href in parsed['hrefs']:
             normalized_url = self.normalize_url(href, url)
-            if normalized_url and normalized_url not in self.crawled_urls:
-                new_links.append(normalized_url)
-        
-        # Also try to find more links from common patterns
-        for script in soup.find_all('script'):
-            if script.string:
-                # Look for URLs in JavaScript
-                import re
-                urls = re.findall(r'["\'](https?://[^"\']+)["\']', script.string)
-                for found_url in urls:
-                    normalized_url = self.normalize_url(found_url, url)
-                    if normalized_url and normalized_url not in self.crawled_urls and normalized_url not in new_links:
-                        new_links.append(normalized_url)
-        
+            if normalized_url and normalized_url not in new_links and not self._seen_url(normalized_url):
+                new_links[normalized_url] = None
+
+        # Also try to find more links from common patterns (URLs in JavaScript)
+        for found_url in parsed['script_urls']:
+            normalized_url = self.normalize_url(found_url, url)
+            if normalized_url and normalized_url not in new_links and not self._seen_url(normalized_url):
+                new_links[normalized_url] = None
+        new_links = list(new_links)
+
         # Perform content analysis
         content_type = self.smart_filter.detect_content_type(url, title_text, all_text, text_data.get('meta_data', {}))
         quality_level, quality_score = self.smart_filter.assess_content_quality(all_text, text_data)
         language = self.smart_filter.detect_language(all_text)
-        
-        return {
+
+        page_data = {
             'url': url,
             'success': True,
             'title': title_text,
-            'word_count': word_count,
+            'word_count': parsed['word_count'],
             'text_content': all_text[:5000],  # First 5000 chars
             'detailed_text': text_data,
             'new_links': new_links,
-            'status_code': response.status_code,
-            'method': 'requests',
+            'method': method,
             'content_analysis': {
                 'content_type': content_type.value,
                 'quality_score': quality_score,
@@ -337,88 +686,80 @@ class AdvancedWebCrawler:
                 'language': language
             }
         }
+        if status_code is not None:
+            page_data['status_code'] = status_code
+        return page_data
+
+    def _crawl_with_requests(self, url: str) -> Dict[str, Any]:
+        """Crawl page using requests."""
+        # Stream with a split connect/read timeout so the body can be
+        # inspected and capped before it is buffered
+        response = self.session.get(url, stream=True, timeout=(5, 30))
+        try:
+            response.raise_for_status()
+
+            # Skip the parse entirely for images, PDFs and other binaries
+            content_type = response.headers.get('Content-Type', '')
+            if content_type and not content_type.startswith(('text/html', 'application/xhtml')):
+                return {
+                    'url': url,
+                    'success': False,
+                    'error': f'Skipped non-HTML content type: {content_type}'
+                }
+
+            content = response.raw.read(self.max_body_bytes + 1, decode_content=True)
+            if len(content) > self.max_body_bytes:
+                return {
+                    'url': url,
+                    'success': False,
+                    'error': f'Response body exceeded {self.max_body_bytes} bytes'
+                }
+        finally:
+            response.close()
+
+        return self._finish_page_data(url, _parse_html(content),
+                                      method='requests', status_code=response.status_code)
     
     def _crawl_with_selenium(self, url: str) -> Dict[str, Any]:
         """Crawl page using Selenium."""
-        driver = None
         try:
-            driver = self.setup_selenium_driver()
+            driver = self._get_selenium_driver()
             driver.get(url)
-            time.sleep(3)  # Wait for page to load
-            
-            # Wait for body to be present
+
+            # Wait for the document to finish loading instead of a fixed sleep
+            WebDriverWait(driver, 20).until(
+                lambda d: d.execute_script("return document.readyState") == "complete"
+            )
             WebDriverWait(driver, 20).until(
                 EC.presence_of_element_located((By.TAG_NAME, "body"))
             )
-            
+
             page_source = driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
-            
-            # Extract comprehensive text data
-            text_data = self.extract_text_content(soup)
-            
-            # Get all text content
-            all_text = soup.get_text(separator=' ', strip=True)
-            
-            # Extract title
-            title = soup.find('title')
-            title_text = title.get_text() if title else "No title found"
-            
-            # Count words
-            word_count = len(all_text.split())
-            
-            # Find new links
-            new_links = []
-            links = soup.find_all('a', href=True)
-            for link in links:
-                href = link.get('href')
-                normalized_url = self.normalize_url(href, url)
-                if normalized_url and normalized_url not in self.crawled_urls:
-                    new_links.append(normalized_url)
-            
-            # Perform content analysis
-            content_type = self.smart_filter.detect_content_type(url, title_text, all_text, text_data.get('meta_data', {}))
-            quality_level, quality_score = self.smart_filter.assess_content_quality(all_text, text_data)
-            language = self.smart_filter.detect_language(all_text)
-            
-            return {
-                'url': url,
-                'success': True,
-                'title': title_text,
-                'word_count': word_count,
-                'text_content': all_text[:5000],  # First 5000 chars
-                'detailed_text': text_data,
-                'new_links': new_links,
-                'method': 'selenium',
-                'content_analysis': {
-                    'content_type': content_type.value,
-                    'quality_score': quality_score,
-                    'quality_level': quality_level.value,
-                    'language': language
-                }
-            }
-            
+            return self._finish_page_data(url, _parse_html(page_source), method='selenium')
+
         except Exception as e:
+            # A wedged browser would poison every later page; restart fresh
+            self.close()
             return {
                 'url': url,
                 'success': False,
                 'error': str(e)
             }
-        finally:
-            if driver:
-                driver.quit()
-    
+
     def crawl_website(self, start_url: str, use_selenium: bool = False, filter_config: ContentFilter = None) -> Dict[str, Any]:
         """Crawl entire website starting from given URL."""
         self.logger.info(f"Starting advanced crawl of: {start_url}")
         
         # Reset state for new crawl
         self.crawled_urls = set()
+        self.seen_bloom = self._new_bloom()
         self.pages_data = []
+        self._stats = {'total_words': 0, 'total_links': 0, 'total_images': 0}
         
         # Setup
-        self.domain = urllib.parse.urlparse(start_url).netloc
-        self.url_queue = [start_url]
+        self.domain = _urlparse(start_url).netloc
+        self.url_queue = deque([start_url])
+        self._queued = {hash(start_url)}
         
         # Store filter configuration
         self.filter_config = filter_config
@@ -431,11 +772,11 @@ class AdvancedWebCrawler:
         page_count = 0
         
         while self.url_queue and page_count < self.max_pages:
-            url = self.url_queue.pop(0)
+            url = self.url_queue.popleft()
             self.logger.info(f"Processing URL: {url}")
             
             # Skip if already crawled
-            if url in self.crawled_urls:
+            if self._seen_url(url):
                 self.logger.info(f"URL already crawled, skipping: {url}")
                 continue
             
@@ -445,16 +786,19 @@ class AdvancedWebCrawler:
             
             if page_data and page_data.get('success'):
                 # Mark as crawled only after successful crawl
-                self.crawled_urls.add(url)
-                self.pages_data.append(page_data)
+                self._mark_crawled(url)
+                self._record_page(page_data)
                 
                 # Add new links to queue (limit to avoid infinite queue)
                 new_links = page_data.get('new_links', [])
                 for link in new_links[:20]:  # Limit to 20 links per page
-                    if (link not in self.crawled_urls and 
-                        link not in self.url_queue and 
+                    # Queue membership via O(1) fingerprint set instead of
+                    # scanning the queue list per link
+                    if (not self._seen_url(link) and 
+                        hash(link) not in self._queued and 
                         len(self.url_queue) < 100):  # Limit queue size
                         self.url_queue.append(link)
+                        self._queued.add(hash(link))
                 
                 page_count += 1
                 self.logger.info(f"Successfully crawled page {page_count}: {url}")
@@ -471,25 +815,148 @@ class AdvancedWebCrawler:
         if hasattr(self, 'filter_config') and self.filter_config:
             self.logger.info("Applying smart content filtering...")
             self.pages_data = self.smart_filter.filter_content(self.pages_data, self.filter_config)
+            # Running totals no longer match the filtered set
+            self._stats = None
             self.logger.info(f"Filtered to {len(self.pages_data)} pages")
         
         return self.generate_report()
     
+    async def _fetch_page_async(self, session, url: str, semaphore, limiter) -> tuple:
+        """Fetch a single URL under the shared concurrency semaphore and the
+        per-host politeness limiter.
+
+        Returns raw bytes so parsing (possibly in a worker process) pays
+        no extra encode/decode round trip."""
+        async with semaphore:
+            await limiter.wait(_urlparse(url).netloc)
+            async with session.get(url) as response:
+                response.raise_for_status()
+                return url, await response.read()
+
+    async def crawl_website_async(self, start_url: str, max_concurrency: int = 10,
+                                  filter_config: ContentFilter = None,
+                                  parse_in_processes: bool = True) -> Dict[str, Any]:
+        """Async variant of crawl_website using aiohttp.
+
+        Crawling is dominated by waiting on remote HTTP, so each wave of the
+        URL frontier is downloaded concurrently (bounded by max_concurrency)
+        while parsing stays synchronous. Requires aiohttp.
+        """
+        if aiohttp is None:
+            raise ImportError("aiohttp is required for crawl_website_async (pip install aiohttp)")
+
+        self.logger.info(f"Starting async crawl of: {start_url}")
+
+        # Reset state for new crawl
+        self.crawled_urls = set()
+        self.seen_bloom = self._new_bloom()
+        self.pages_data = []
+        self._stats = {'total_words': 0, 'total_links': 0, 'total_images': 0}
+        self.domain = _urlparse(start_url).netloc
+        self.url_queue = deque([start_url])
+        self._queued = {hash(start_url)}
+        self.filter_config = filter_config
+
+        # Check robots.txt
+        if not self.check_robots_txt(start_url):
+            self.logger.warning("Crawling not allowed by robots.txt")
+            return {'error': 'Crawling not allowed by robots.txt'}
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        # Politeness: the async path honors self.delay per host instead of
+        # a blanket sleep, so multi-host frontiers still overlap fully
+        limiter = _HostRateLimiter(self.delay)
+        timeout = aiohttp.ClientTimeout(total=30)
+        # Bound per-host sockets (politeness) and cache DNS lookups for the
+        # life of the crawl instead of resolving every page
+        connector = aiohttp.TCPConnector(limit=max_concurrency, limit_per_host=4,
+                                         ttl_dns_cache=300)
+        async with aiohttp.ClientSession(headers=dict(self.session.headers), timeout=timeout,
+                                         connector=connector) as session:
+            while self.url_queue and len(self.pages_data) < self.max_pages:
+                # Take the next wave of unseen URLs from the frontier
+                batch = []
+                while self.url_queue and len(batch) < max_concurrency:
+                    url = self.url_queue.popleft()
+                    if not self._seen_url(url):
+                        batch.append(url)
+                if not batch:
+                    continue
+
+                fetched = await asyncio.gather(
+                    *(self._fetch_page_async(session, url, semaphore, limiter) for url in batch),
+                    return_exceptions=True
+                )
+
+                # Parsing is CPU bound, so fan the wave out to the process
+                # pool; only plain dicts cross the pickle boundary
+                loop = asyncio.get_running_loop()
+                parse_jobs = []
+                for item in fetched:
+                    if isinstance(item, Exception):
+                        self.logger.warning(f"Async fetch failed: {item}")
+                        continue
+                    url, html = item
+                    if parse_in_processes:
+                        parse_jobs.append((url, loop.run_in_executor(
+                            _get_parse_pool(), _parse_page_worker, html)))
+                    else:
+                        parse_jobs.append((url, None, html))
+
+                for job in parse_jobs:
+                    if len(self.pages_data) >= self.max_pages:
+                        break
+                    if parse_in_processes:
+                        url, future = job
+                        parsed = await future
+                    else:
+                        url, _, html = job
+                        parsed = _parse_html(html)
+                    page_data = self._finish_page_data(url, parsed, method='aiohttp')
+                    self._mark_crawled(url)
+                    self._record_page(page_data)
+
+                    # Add new links to queue (limit to avoid infinite queue)
+                    for link in page_data.get('new_links', [])[:20]:
+                        if (not self._seen_url(link) and
+                                hash(link) not in self._queued and
+                                len(self.url_queue) < 100):
+                            self.url_queue.append(link)
+                            self._queued.add(hash(link))
+
+        self.logger.info(f"Total pages crawled: {len(self.pages_data)}")
+
+        # Apply smart filtering if configured
+        if self.filter_config:
+            self.logger.info("Applying smart content filtering...")
+            self.pages_data = self.smart_filter.filter_content(self.pages_data, self.filter_config)
+            # Running totals no longer match the filtered set
+            self._stats = None
+            self.logger.info(f"Filtered to {len(self.pages_data)} pages")
+
+        return self.generate_report()
+
     def generate_report(self) -> Dict[str, Any]:
         """Generate comprehensive crawling report."""
         if not self.pages_data:
             return {'error': 'No pages were successfully crawled'}
         
-        # Calculate statistics
-        total_words = sum(page.get('word_count', 0) for page in self.pages_data)
-        total_links = sum(len(page.get('new_links', [])) for page in self.pages_data)
-        total_images = sum(len(page.get('detailed_text', {}).get('images', [])) for page in self.pages_data)
+        # Use the running totals kept during the crawl; recompute only when
+        # smart filtering dropped pages after the fact
+        if self._stats is not None:
+            total_words = self._stats['total_words']
+            total_links = self._stats['total_links']
+            total_images = self._stats['total_images']
+        else:
+            total_words = sum(page.get('word_count', 0) for page in self.pages_data)
+            total_links = sum(len(page.get('new_links', [])) for page in self.pages_data)
+            total_images = sum(len(page.get('detailed_text', {}).get('images', [])) for page in self.pages_data)
         
         # Build site structure
         site_structure = {}
         for page in self.pages_data:
             url = page['url']
-            path_parts = urllib.parse.urlparse(url).path.strip('/').split('/')
+            path_parts = _urlparse(url).path.strip('/').split('/')
             
             current_level = site_structure
             for part in path_parts:
@@ -534,15 +1001,15 @@ class AdvancedWebCrawler:
     
     def _get_most_common_headings(self) -> Dict[str, int]:
         """Get most common headings across all pages."""
-        heading_counts = defaultdict(int)
-        for page in self.pages_data:
-            detailed_text = page.get('detailed_text', {})
-            headings = detailed_text.get('headings', {})
-            for heading_type, heading_list in headings.items():
-                for heading in heading_list:
-                    heading_counts[heading] += 1
-        
-        return dict(sorted(heading_counts.items(), key=lambda x: x[1], reverse=True)[:10])
+        # One generator feeds Counter's C-level update; most_common(10) is
+        # a heap-based top-k, not a full sort
+        heading_counts = Counter(
+            heading
+            for page in self.pages_data
+            for heading_list in page.get('detailed_text', {}).get('headings', {}).values()
+            for heading in heading_list
+        )
+        return dict(heading_counts.most_common(10))
     
     def _analyze_content_types(self) -> Dict[str, int]:
         """Analyze content types across all pages."""
@@ -564,9 +1031,37 @@ class AdvancedWebCrawler:
             filename = f"advanced_crawl_{self.domain}_{timestamp}.json"
         
         report = self.generate_report()
-        
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+
+        if orjson is not None:
+            # orjson emits raw UTF-8 bytes directly, and the pages list is
+            # streamed one entry at a time so the file write never holds a
+            # second full copy of the crawl in memory
+            pages = report.get('pages')
+            with open(filename, 'wb') as f:
+                if isinstance(pages, list):
+                    f.write(b'{')
+                    first = True
+                    for key, value in report.items():
+                        if not first:
+                            f.write(b',')
+                        first = False
+                        f.write(orjson.dumps(key))
+                        f.write(b':')
+                        if key == 'pages':
+                            f.write(b'[')
+                            for i, page in enumerate(pages):
+                                if i:
+                                    f.write(b',')
+                                f.write(orjson.dumps(page))
+                            f.write(b']')
+                        else:
+                            f.write(orjson.dumps(value))
+                    f.write(b'}')
+                else:
+                    f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
         
         self.logger.info(f"Results saved to: {filename}")
         return filename
@@ -1,23 +1,247 @@
-from flask import Flask, request, jsonify, render_template, send_from_directory
+from flask import Flask, request, render_template, send_from_directory, Response
 from flask_cors import CORS
-from crawler import WebCrawler
-from advanced_crawler import AdvancedWebCrawler
-from smart_filter import SmartContentFilter, ContentFilter, ContentType
-from visualization_dashboard import DataVisualizationDashboard
-import json
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+import hashlib
+import queue
+import threading
+import uuid
+import requests
+from fake_useragent import UserAgent
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
+import sys
 from datetime import datetime
 import time
 
+# Interned keys for the per-page aggregation loop; pointer-equality hits
+# the dict lookup fast path when pages number in the thousands
+_WORD_COUNT = sys.intern('word_count')
+_QUALITY_SCORE = sys.intern('quality_score')
+_CONTENT_TYPE = sys.intern('content_type')
+_LANGUAGE = sys.intern('language')
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Compiled numeric reduction over pages; None when NumPy/Numba are missing
+from aggregate import aggregate_counts
+
+# ujson is a drop-in stdlib replacement (~3x faster) for when orjson
+# cannot be installed
+try:
+    import ujson as json
+except ImportError:
+    import json
+
+# Shared HTTP session: crawls across API requests reuse pooled keep-alive
+# connections instead of paying the TCP/TLS handshake per page
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64,
+                       max_retries=Retry(total=2, backoff_factor=0.3))
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+SESSION.headers.update({
+    'User-Agent': UserAgent().random,
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+})
+
 app = Flask(__name__, template_folder='templates', static_folder='static')
+# Crawl results can be multi-MB payloads; cap request bodies at 64 MB
+app.config['MAX_CONTENT_LENGTH'] = 64 * 1024 * 1024
 CORS(app)
 
-# Initialize the crawlers
-crawler = WebCrawler()
-smart_filter = SmartContentFilter()
-visualization_dashboard = DataVisualizationDashboard()
+# Compress the large JSON/HTML responses when flask-compress is installed;
+# Brotli quality 4 is the best ratio/CPU tradeoff for JSON payloads
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
+if Compress is not None:
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    app.config['COMPRESS_MIN_SIZE'] = 1024
+    app.config['COMPRESS_LEVEL'] = 4
+    Compress(app)
+
+
+def _json_response(data, status=200):
+    """Serialize data with orjson (much faster than jsonify's stdlib json)."""
+    if orjson is not None:
+        return Response(orjson.dumps(data), status=status, mimetype='application/json')
+    return Response(json.dumps(data), status=status, mimetype='application/json')
+
+
+def _get_request_json():
+    """Parse the request body with orjson when available (faster than get_json)."""
+    if orjson is not None:
+        return orjson.loads(request.get_data())
+    return request.get_json()
+
+def _dedupe_pages(pages):
+    """Drop duplicate page entries by URL, keeping first-seen order."""
+    return list({page.get('url'): page for page in pages}.values())
+
+
+def _aggregate_pages(pages):
+    """Collect word/quality totals and unique types/languages in a single pass.
+
+    Uniqueness is tracked with dicts (dict.fromkeys style) so the returned
+    lists keep first-seen order instead of arbitrary set order.
+    """
+    content_types = {}
+    languages = {}
+    if aggregate_counts is not None:
+        # JIT-compiled numeric reduction; only the string uniqueness stays
+        # in Python, where interning dominates anyway
+        total_words, avg_quality_score = aggregate_counts(pages)
+        for page in pages:
+            content_types[page.get(_CONTENT_TYPE, 'Unknown')] = None
+            languages[page.get(_LANGUAGE, 'Unknown')] = None
+    else:
+        total_words = 0
+        quality_total = 0
+        for page in pages:
+            total_words += page.get(_WORD_COUNT, 0)
+            quality_total += page.get(_QUALITY_SCORE, 0)
+            content_types[page.get(_CONTENT_TYPE, 'Unknown')] = None
+            languages[page.get(_LANGUAGE, 'Unknown')] = None
+        avg_quality_score = quality_total / len(pages) if pages else 0
+    return total_words, avg_quality_score, list(content_types), list(languages)
+
+
+def _warm():
+    """Pay one-time initialization (JIT compile, parser load, serializer
+    setup) at startup so the first user request doesn't absorb it."""
+    if aggregate_counts is not None:
+        aggregate_counts([{'word_count': 1, 'quality_score': 1.0}])
+    if orjson is not None:
+        orjson.dumps({'x': 1})
+    try:
+        from selectolax.parser import HTMLParser
+        HTMLParser('<html></html>').css('a')
+    except ImportError:
+        pass
+
+
+# Run at import: before_first_request is gone in Flask 2.3+, and waitress
+# serves the module-level app anyway
+_warm()
+
+
+@lru_cache(maxsize=1)
+def _get_web_crawler():
+    """Shared WebCrawler; one instance serves all /crawl requests without
+    re-running constructor warmup. The cached Selenium driver it keeps is
+    guarded by the crawler's internal lock, so concurrent fallbacks to the
+    Selenium path serialize instead of racing one Chrome."""
+    from crawler import WebCrawler
+    return WebCrawler(session=SESSION)
+
+
+# Pools of reusable AdvancedWebCrawler instances keyed by configuration, so
+# repeated requests skip constructor warmup (UserAgent tables, smart-filter
+# patterns)
+_CRAWLER_POOLS = {}
+_CRAWLER_POOLS_LOCK = threading.Lock()
+
+
+@contextmanager
+def _pooled_advanced_crawler(max_pages, delay):
+    with _CRAWLER_POOLS_LOCK:
+        pool = _CRAWLER_POOLS.setdefault((max_pages, delay), queue.Queue())
+    try:
+        crawler = pool.get_nowait()
+    except queue.Empty:
+        from advanced_crawler import AdvancedWebCrawler
+        crawler = AdvancedWebCrawler(max_pages=max_pages, delay=delay, session=SESSION)
+        # Temporarily bypass robots.txt check
+        crawler.check_robots_txt = lambda x: True
+    try:
+        crawler.reset_state()
+        yield crawler
+    finally:
+        pool.put(crawler)
+
+
+# The crawler/filter/visualization modules pull in Selenium, BeautifulSoup
+# and matplotlib, so they are imported lazily on first use to keep worker
+# startup fast and /health cheap.
+@lru_cache(maxsize=1)
+def _get_smart_filter():
+    from smart_filter import SmartContentFilter
+    return SmartContentFilter()
+
+
+@lru_cache(maxsize=1)
+def _get_visualization_dashboard():
+    from visualization_dashboard import DataVisualizationDashboard
+    return DataVisualizationDashboard()
 
-@app.route('/')
+# Background crawl jobs: POST with {"async": true} to get a job id back
+# immediately instead of holding the connection for the whole crawl, then
+# poll /crawl/status/<id>. Crawls are I/O bound, so threads overlap well.
+EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count() or 4)
+_JOBS = {}  # job_id -> [future, done_at or None while running]
+_JOBS_LOCK = threading.Lock()
+# How long a finished job's result waits to be polled before eviction;
+# without it, never-polled jobs would hold their multi-MB results for
+# the life of the server
+_JOB_TTL = 600.0
+
+
+def _mark_job_done(job_id):
+    with _JOBS_LOCK:
+        entry = _JOBS.get(job_id)
+        if entry is not None:
+            entry[1] = time.monotonic()
+
+
+def _submit_job(fn):
+    job_id = uuid.uuid4().hex
+    now = time.monotonic()
+    with _JOBS_LOCK:
+        # Sweep finished jobs nobody polled within the TTL
+        for jid in [jid for jid, (_, done_at) in _JOBS.items()
+                    if done_at is not None and now - done_at > _JOB_TTL]:
+            del _JOBS[jid]
+    future = EXECUTOR.submit(fn)
+    with _JOBS_LOCK:
+        _JOBS[job_id] = [future, None]
+    future.add_done_callback(lambda _f: _mark_job_done(job_id))
+    return job_id
+
+
+@app.route('/crawl/status/<job_id>', methods=['GET'])
+def crawl_status(job_id):
+    """Poll a background crawl job; the result is returned once, when done."""
+    with _JOBS_LOCK:
+        entry = _JOBS.get(job_id)
+    if entry is None:
+        return _json_response({'success': False, 'error': 'Unknown job id'}, status=404)
+    future = entry[0]
+    if not future.done():
+        return _json_response({'done': False})
+    with _JOBS_LOCK:
+        _JOBS.pop(job_id, None)
+    try:
+        payload, status = future.result()
+        return _json_response({'done': True, 'result': payload}, status=status)
+    except Exception as e:
+        return _json_response({'done': True, 'success': False, 'error': str(e)}, status=500)
+
+
+@app.route('/', methods=['GET'])
 def index():
     """Serve the main web interface."""
     return render_template('index.html')
@@ -26,82 +250,97 @@ def index():
 def crawl_website():
     """API endpoint for basic crawling."""
     try:
-        data = request.get_json()
+        data = _get_request_json()
         url = data.get('url')
         
         if not url:
-            return jsonify({'success': False, 'error': 'URL is required'}), 400
+            return _json_response({'success': False, 'error': 'URL is required'}, status=400)
         
-        # Create a fresh crawler instance
-        crawler = WebCrawler()
-        result = crawler.crawl_website(url, use_selenium=False)
-        
-        if result.get('success'):
-            # Calculate additional metrics
-            total_words = result.get('total_words', 0)
-            avg_quality_score = result.get('avg_quality_score', 0)
+        def run_crawl():
+            # Reuse the shared crawler instance
+            crawler = _get_web_crawler()
+            result = crawler.crawl_website(url, use_selenium=False)
             
-            result.update({
-                'total_words': total_words,
-                'avg_quality_score': round(avg_quality_score, 2)
-            })
+            if result.get('success'):
+                # Calculate additional metrics
+                total_words = result.get('total_words', 0)
+                avg_quality_score = result.get('avg_quality_score', 0)
+                
+                result.update({
+                    'total_words': total_words,
+                    'avg_quality_score': round(avg_quality_score, 2)
+                })
+            
+            return result, 200
+        
+        if data.get('async'):
+            return _json_response({'success': True, 'job_id': _submit_job(run_crawl)}, status=202)
         
-        return jsonify(result)
+        payload, status = run_crawl()
+        return _json_response(payload, status=status)
         
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return _json_response({'success': False, 'error': str(e)}, status=500)
 
 @app.route('/advanced-crawl', methods=['POST'])
 def advanced_crawl_website():
     """API endpoint for advanced crawling."""
     try:
-        data = request.get_json()
+        data = _get_request_json()
         url = data.get('url')
         max_pages = data.get('max_pages', 10)
         wait_time = data.get('wait_time', 1)
         headless = data.get('headless', True)
-        
+        concurrent = data.get('concurrent', False)
+        max_concurrency = data.get('max_concurrency', 10)
+
         if not url:
-            return jsonify({'success': False, 'error': 'URL is required'}), 400
-        
-        # Create a fresh advanced crawler instance
-        advanced_crawler = AdvancedWebCrawler(
-            max_pages=max_pages,
-            delay=wait_time
-        )
-        
-        # Temporarily bypass robots.txt check
-        advanced_crawler.check_robots_txt = lambda x: True
-        
-        start_time = time.time()
-        # Use headless=True for requests, headless=False for selenium
-        use_selenium = not headless  # headless=True means use requests, headless=False means use Selenium
-        
-        result = advanced_crawler.crawl_website(url, use_selenium=use_selenium)
-        execution_time = round(time.time() - start_time, 2)
-        
-        if result.get('success'):
-            # Calculate additional metrics
-            pages = result.get('pages', [])
-            total_words = sum(page.get('word_count', 0) for page in pages)
-            avg_quality_score = sum(page.get('quality_score', 0) for page in pages) / len(pages) if pages else 0
+            return _json_response({'success': False, 'error': 'URL is required'}, status=400)
+
+        def run_crawl():
+            start_time = time.time()
+            # Use headless=True for requests, headless=False for selenium
+            use_selenium = not headless  # headless=True means use requests, headless=False means use Selenium
+
+            # Borrow a pooled advanced crawler instance
+            with _pooled_advanced_crawler(max_pages, wait_time) as advanced_crawler:
+                if concurrent and not use_selenium:
+                    # Fetch pages concurrently with the aiohttp crawler;
+                    # wall-clock drops to roughly pages/max_concurrency RTTs
+                    result = asyncio.run(advanced_crawler.crawl_website_async(
+                        url, max_concurrency=max_concurrency))
+                else:
+                    result = advanced_crawler.crawl_website(url, use_selenium=use_selenium)
+            execution_time = round(time.time() - start_time, 2)
             
-            result.update({
-                'total_words': total_words,
-                'avg_quality_score': round(avg_quality_score, 2),
-                'execution_time': execution_time
-            })
+            if result.get('success'):
+                # Calculate additional metrics
+                pages = _dedupe_pages(result.get('pages', []))
+                result['pages'] = pages
+                total_words, avg_quality_score, _, _ = _aggregate_pages(pages)
+                
+                result.update({
+                    'total_words': total_words,
+                    'avg_quality_score': round(avg_quality_score, 2),
+                    'execution_time': execution_time
+                })
+            
+            return result, 200
+        
+        if data.get('async'):
+            return _json_response({'success': True, 'job_id': _submit_job(run_crawl)}, status=202)
         
-        return jsonify(result)
+        payload, status = run_crawl()
+        return _json_response(payload, status=status)
         
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return _json_response({'success': False, 'error': str(e)}, status=500)
 
 @app.route('/smart-filter-crawl', methods=['POST'])
 def smart_filter_crawl_website():
     """API endpoint for smart filtering with crawling."""
     try:
-        data = request.get_json()
+        data = _get_request_json()
         url = data.get('url')
         max_pages = data.get('max_pages', 10)
         min_quality = data.get('min_quality', 70)
@@ -109,85 +348,115 @@ def smart_filter_crawl_website():
         languages = data.get('languages', [])
         
         if not url:
-            return jsonify({'success': False, 'error': 'URL is required'}), 400
+            return _json_response({'success': False, 'error': 'URL is required'}, status=400)
         
         # Create content filter
+        from smart_filter import ContentFilter
         content_filter = ContentFilter(
             min_quality_score=min_quality,
             content_types=content_types,
             language=languages[0] if languages else None
         )
         
-        # Create a fresh advanced crawler instance
-        advanced_crawler = AdvancedWebCrawler(
-            max_pages=max_pages,
-            delay=1
-        )
-        
-        # Temporarily bypass robots.txt check
-        advanced_crawler.check_robots_txt = lambda x: True
-        
-        # Use advanced crawler WITHOUT smart filtering first to test
-        result = advanced_crawler.crawl_website(url, use_selenium=False, filter_config=None)
-        
-        # Check if we got a valid result
-        if result and isinstance(result, dict):
+        def run_crawl():
+            # Use advanced crawler WITHOUT smart filtering first to test,
+            # borrowing a pooled instance
+            with _pooled_advanced_crawler(max_pages, 1) as advanced_crawler:
+                result = advanced_crawler.crawl_website(url, use_selenium=False, filter_config=None)
+            
+            # Check if we got a valid result
+            if not (result and isinstance(result, dict)):
+                return {'success': False, 'error': 'No pages were successfully crawled'}, 400
+            
             # Handle the result structure
             if 'error' in result:
-                return jsonify({'success': False, 'error': result['error']}), 400
+                return {'success': False, 'error': result['error']}, 400
             
             # If result has pages, process them
-            if 'pages' in result and result['pages']:
-                pages = result['pages']
-                total_words = sum(page.get('word_count', 0) for page in pages)
-                avg_quality_score = sum(page.get('quality_score', 0) for page in pages) / len(pages) if pages else 0
-                
-                # Get unique content types and languages
-                content_types_found = list(set(page.get('content_type', 'Unknown') for page in pages))
-                languages_found = list(set(page.get('language', 'Unknown') for page in pages))
-                
-                # Return the full result with additional fields
-                result.update({
-                    'total_words': total_words,
-                    'avg_quality_score': round(avg_quality_score, 2),
-                    'filtered_pages': len(pages),
-                    'content_types': content_types_found,
-                    'languages': languages_found
-                })
-            else:
+            if not result.get('pages'):
                 # No pages found
-                return jsonify({'success': False, 'error': 'No pages were successfully crawled'}), 400
-        else:
-            return jsonify({'success': False, 'error': 'No pages were successfully crawled'}), 400
+                return {'success': False, 'error': 'No pages were successfully crawled'}, 400
+            
+            pages = _dedupe_pages(result['pages'])
+            result['pages'] = pages
+            total_words, avg_quality_score, content_types_found, languages_found = _aggregate_pages(pages)
+            
+            # Return the full result with additional fields
+            result.update({
+                'total_words': total_words,
+                'avg_quality_score': round(avg_quality_score, 2),
+                'filtered_pages': len(pages),
+                'content_types': content_types_found,
+                'languages': languages_found
+            })
+            
+            return result, 200
+        
+        if data.get('async'):
+            return _json_response({'success': True, 'job_id': _submit_job(run_crawl)}, status=202)
         
-        return jsonify(result)
+        payload, status = run_crawl()
+        return _json_response(payload, status=status)
         
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return _json_response({'success': False, 'error': str(e)}, status=500)
+
+# Dedicated pool for the three independent visualization builds per request
+VIZ_POOL = ThreadPoolExecutor(max_workers=3)
+
+# Rendered visualization HTML keyed by payload digest; clients often
+# re-render identical crawl data while tweaking the UI, and a hit skips
+# all three builds entirely
+_VIZ_CACHE = OrderedDict()
+_VIZ_CACHE_LOCK = threading.Lock()
+_VIZ_CACHE_MAX = 64
+
+
+def _crawl_data_key(crawl_data):
+    """Stable 16-byte BLAKE2b digest of a crawl payload for cache keying."""
+    if orjson is not None:
+        payload = orjson.dumps(crawl_data, option=orjson.OPT_SORT_KEYS)
+    else:
+        payload = json.dumps(crawl_data, sort_keys=True).encode()
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
 
 @app.route('/visualize', methods=['POST'])
 def create_visualizations():
     """API endpoint to create data visualizations."""
     try:
-        data = request.get_json()
+        data = _get_request_json()
         crawl_data = data.get('crawl_data')
         
         if not crawl_data:
-            return jsonify({'success': False, 'error': 'Crawl data is required'}), 400
+            return _json_response({'success': False, 'error': 'Crawl data is required'}, status=400)
         
         # Create visualizations using the correct method
         try:
-            # Create AI text analysis dashboard
-            dashboard_html = visualization_dashboard.create_ai_text_analysis_dashboard(crawl_data)
-            
-            # Create text extraction visualization
-            extraction_html = visualization_dashboard.create_text_extraction_visualization(crawl_data)
-            
-            # Create AI content quality report (with empty ai_analysis if not provided)
-            ai_analysis = crawl_data.get('ai_analysis', {})
-            quality_html = visualization_dashboard.create_ai_content_quality_report(crawl_data, ai_analysis)
-            
-            return jsonify({
+            cache_key = _crawl_data_key(crawl_data)
+            with _VIZ_CACHE_LOCK:
+                cached = _VIZ_CACHE.get(cache_key)
+                if cached is not None:
+                    _VIZ_CACHE.move_to_end(cache_key)
+            if cached is not None:
+                dashboard_html, extraction_html, quality_html = cached
+            else:
+                visualization_dashboard = _get_visualization_dashboard()
+                ai_analysis = crawl_data.get('ai_analysis', {})
+
+                # The three builds are independent, so run them concurrently;
+                # wall-clock drops from t1+t2+t3 to max(t1,t2,t3)
+                f1 = VIZ_POOL.submit(visualization_dashboard.create_ai_text_analysis_dashboard, crawl_data)
+                f2 = VIZ_POOL.submit(visualization_dashboard.create_text_extraction_visualization, crawl_data)
+                f3 = VIZ_POOL.submit(visualization_dashboard.create_ai_content_quality_report, crawl_data, ai_analysis)
+                dashboard_html, extraction_html, quality_html = f1.result(), f2.result(), f3.result()
+
+                with _VIZ_CACHE_LOCK:
+                    _VIZ_CACHE[cache_key] = (dashboard_html, extraction_html, quality_html)
+                    while len(_VIZ_CACHE) > _VIZ_CACHE_MAX:
+                        _VIZ_CACHE.popitem(last=False)
+
+            return _json_response({
                 'success': True,
                 'message': "Created 3 visualization types successfully",
                 'visualizations': {
@@ -197,10 +466,10 @@ def create_visualizations():
                 }
             })
         except Exception as viz_error:
-            return jsonify({'success': False, 'error': f'Visualization error: {str(viz_error)}'}), 500
+            return _json_response({'success': False, 'error': f'Visualization error: {str(viz_error)}'}, status=500)
         
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return _json_response({'success': False, 'error': str(e)}, status=500)
 
 @app.route('/dashboard', methods=['GET'])
 def get_dashboard():
@@ -211,12 +480,12 @@ def get_dashboard():
 def download_json():
     """API endpoint for downloading crawl results as JSON."""
     try:
-        data = request.get_json()
+        data = _get_request_json()
         crawl_data = data.get('crawl_data')
         filename = data.get('filename', 'crawl_results.json')
         
         if not crawl_data:
-            return jsonify({'success': False, 'error': 'Crawl data is required'}), 400
+            return _json_response({'success': False, 'error': 'Crawl data is required'}, status=400)
         
         # Ensure filename has .json extension
         if not filename.endswith('.json'):
@@ -224,16 +493,13 @@ def download_json():
         
         # Create downloads directory if it doesn't exist
         downloads_dir = 'downloads'
-        if not os.path.exists(downloads_dir):
-            os.makedirs(downloads_dir)
-        
+        os.makedirs(downloads_dir, exist_ok=True)
+
         filepath = os.path.join(downloads_dir, filename)
+
+        _write_crawl_json(crawl_data, filepath)
         
-        # Save the data to JSON file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(crawl_data, f, indent=2, ensure_ascii=False)
-        
-        return jsonify({
+        return _json_response({
             'success': True, 
             'filename': filename,
             'filepath': filepath,
@@ -241,28 +507,68 @@ def download_json():
         })
         
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return _json_response({'success': False, 'error': str(e)}, status=500)
+
+def _write_crawl_json(crawl_data, filepath):
+    """Write crawl data to filepath, streaming pages one at a time.
+
+    Serializing page-by-page keeps peak memory near the size of a single
+    page instead of a second full copy of a multi-MB crawl result.
+    """
+    pages = crawl_data.get('pages') if isinstance(crawl_data, dict) else None
+    if orjson is None:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(crawl_data, f, indent=2, ensure_ascii=False)
+        return
+    if not isinstance(pages, list):
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(crawl_data, option=orjson.OPT_INDENT_2))
+        return
+    with open(filepath, 'wb') as f:
+        f.write(b'{')
+        first = True
+        for key, value in crawl_data.items():
+            if not first:
+                f.write(b',')
+            first = False
+            f.write(orjson.dumps(key))
+            f.write(b':')
+            if key == 'pages':
+                f.write(b'[')
+                for i, page in enumerate(pages):
+                    if i:
+                        f.write(b',')
+                    f.write(orjson.dumps(page))
+                f.write(b']')
+            else:
+                f.write(orjson.dumps(value))
+        f.write(b'}')
+
 
 @app.route('/downloads/<filename>')
 def serve_download(filename):
-    """Serve downloaded files."""
-    try:
-        downloads_dir = 'downloads'
-        filepath = os.path.join(downloads_dir, filename)
-        
-        if not os.path.exists(filepath):
-            return jsonify({'error': 'File not found'}), 404
-        
-        return send_from_directory(downloads_dir, filename, as_attachment=True)
-        
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    """Serve downloaded files with conditional-get support."""
+    # send_from_directory stats the file itself (404 on a miss, saving the
+    # explicit exists check) and with conditional=True sends an ETag and
+    # Last-Modified so repeat downloads short-circuit with a 304
+    return send_from_directory('downloads', filename, as_attachment=True, conditional=True)
 
 @app.route('/health')
 def health():
     """Health check endpoint."""
-    return jsonify({'status': 'healthy', 'timestamp': datetime.now().isoformat()})
+    return _json_response({'status': 'healthy', 'timestamp': datetime.now().isoformat()})
 
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 8080))
-    app.run(host='0.0.0.0', port=port, debug=True) 
\ No newline at end of file
+    if os.environ.get('FLASK_ENV') == 'development':
+        # Opt-in dev server: the Werkzeug reloader double-imports the app
+        # (re-running warmup and session setup), so never use it by default
+        app.run(host='0.0.0.0', port=port, debug=True)
+    else:
+        try:
+            # Serve with waitress in production - the Werkzeug dev server is
+            # single-threaded and much slower
+            from waitress import serve
+            serve(app, host='0.0.0.0', port=port, threads=8)
+        except ImportError:
+            app.run(host='0.0.0.0', port=port, debug=False) 
\ No newline at end of file
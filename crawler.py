@@ -1,5 +1,36 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+
+# Async multi-URL crawling reuses one connection pool across fetches;
+# optional, like the advanced crawler's async path
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# The C-backed lxml parser is 5-10x faster than the pure-Python default;
+# fall back gracefully when it is not installed
+try:
+    import lxml  # noqa: F401
+    _SOUP_PARSER = 'lxml'
+except ImportError:
+    _SOUP_PARSER = 'html.parser'
+
+# selectolax wraps C HTML5 parsers an order of magnitude faster than
+# BeautifulSoup for text/link extraction; prefer the newer lexbor engine,
+# fall back to the Modest-based one on older installs. Optional.
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser
+    except ImportError:
+        HTMLParser = None
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
@@ -8,24 +39,106 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
 from fake_useragent import UserAgent
-import time
+import threading
 import json
 import re
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
+
+# fake_useragent loads its browser database on first use; one shared
+# instance per process instead of one per WebCrawler
+_UA = UserAgent()
+
+# Only advertise Brotli when urllib3 can actually decode it; most sites
+# serve ~20% smaller bodies as br than gzip
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    _ACCEPT_ENCODING = 'gzip, deflate'
+
+_BASE_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': _ACCEPT_ENCODING,
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+
+def _extract_with_selectolax(content: bytes) -> Tuple[str, str, str, List[str], List[str]]:
+    """Extract (text, title, description, links, images) via selectolax."""
+    tree = HTMLParser(content)
+    text_content = tree.body.text(separator=' ', strip=True) if tree.body else ''
+    title = tree.css_first('title')
+    title_text = title.text() if title else "No title found"
+    meta_desc = tree.css_first('meta[name="description"]')
+    description = meta_desc.attributes.get('content') if meta_desc else "No description found"
+    links = [a.attributes.get('href') for a in tree.css('a[href]')]
+    images = [img.attributes.get('src') for img in tree.css('img[src]')]
+    return text_content, title_text, description, links, images
+
+
+def _extract_with_soup(content) -> Tuple[str, str, str, List[str], List[str]]:
+    """Extract (text, title, description, links, images) via BeautifulSoup.
+
+    Title, meta description, links, and images are collected in one tree
+    walk instead of a find/find_all call per element type.
+    """
+    soup = BeautifulSoup(content, _SOUP_PARSER)
+    text_content = soup.get_text(separator=' ', strip=True)
+    title_text = "No title found"
+    description = "No description found"
+    links = []
+    images = []
+    for el in soup.find_all(['title', 'meta', 'a', 'img']):
+        name = el.name
+        if name == 'a':
+            href = el.get('href')
+            if href:
+                links.append(href)
+        elif name == 'img':
+            src = el.get('src')
+            if src:
+                images.append(src)
+        elif name == 'title':
+            if title_text == "No title found":
+                title_text = el.get_text()
+        elif el.get('name') == 'description':
+            description = el.get('content') or description
+    return text_content, title_text, description, links, images
 
 
 class WebCrawler:
-    def __init__(self):
-        self.ua = UserAgent()
+    # Resolved chromedriver binary path, shared across instances so the
+    # webdriver-manager disk/network check runs once per process
+    _chromedriver_path = None
+
+    def __init__(self, session: Optional[requests.Session] = None,
+                 use_fast_parser: bool = True):
+        self.ua = _UA
+        # Fast C parser for static pages when selectolax is installed
+        self.use_fast_parser = use_fast_parser and HTMLParser is not None
+        # Lazily created, reused across crawls; see _get_selenium_driver.
+        # One Chrome can only serve one page at a time, so concurrent
+        # callers (e.g. the API's shared instance) serialize on the lock
+        self._driver = None
+        self._driver_lock = threading.Lock()
+        if session is not None:
+            # Reuse an injected session (e.g. the API's shared pool) so
+            # crawls across requests share keep-alive connections
+            self.session = session
+            return
         self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': self.ua.random,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        })
+        # Pool and reuse connections so repeated fetches skip the TCP/TLS
+        # handshake, with a small retry budget for flaky hosts
+        adapter = HTTPAdapter(
+            pool_connections=100,
+            pool_maxsize=100,
+            max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update(_BASE_HEADERS | {'User-Agent': self.ua.random})
         
     def setup_selenium_driver(self) -> webdriver.Chrome:
         """Setup Chrome driver with appropriate options for web scraping."""
@@ -39,37 +152,78 @@ class WebCrawler:
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
+        # Text extraction doesn't need images or web fonts — often the
+        # bulk of a page's bytes — so skip downloading them entirely
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-background-networking")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+        })
         
-        service = Service(ChromeDriverManager().install())
+        service = Service(self._get_chromedriver_path())
         driver = webdriver.Chrome(service=service, options=chrome_options)
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         return driver
-    
+
+    @classmethod
+    def _get_chromedriver_path(cls) -> str:
+        """Resolve (and cache) the chromedriver binary path."""
+        if cls._chromedriver_path is None:
+            cls._chromedriver_path = ChromeDriverManager().install()
+        return cls._chromedriver_path
+
+    def _get_selenium_driver(self) -> webdriver.Chrome:
+        """Return the shared driver, creating it on first use.
+
+        Chrome startup costs seconds; reusing one browser across crawls
+        amortizes it. Cookies are cleared per page for isolation.
+        """
+        if self._driver is None:
+            self._driver = self.setup_selenium_driver()
+        return self._driver
+
+    def close(self):
+        """Quit the Selenium driver if one was started."""
+        with self._driver_lock:
+            if self._driver is not None:
+                try:
+                    self._driver.quit()
+                except Exception:
+                    pass
+                self._driver = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @staticmethod
+    def _wait_until_ready(driver, timeout: int, ready_selector: Optional[str] = None):
+        """Block until the document has loaded (and the selector appears)."""
+        WebDriverWait(driver, timeout).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+        if ready_selector:
+            WebDriverWait(driver, timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, ready_selector))
+            )
+
     def crawl_with_requests(self, url: str) -> Dict[str, Any]:
         """Crawl website using requests library for static content."""
         try:
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extract text content
-            text_content = soup.get_text(separator=' ', strip=True)
-            
-            # Extract title
-            title = soup.find('title')
-            title_text = title.get_text() if title else "No title found"
-            
-            # Extract meta description
-            meta_desc = soup.find('meta', attrs={'name': 'description'})
-            description = meta_desc.get('content') if meta_desc else "No description found"
-            
-            # Extract links
-            links = [a.get('href') for a in soup.find_all('a', href=True)]
-            
-            # Extract images
-            images = [img.get('src') for img in soup.find_all('img', src=True)]
-            
+            if self.use_fast_parser:
+                text_content, title_text, description, links, images = \
+                    _extract_with_selectolax(response.content)
+            else:
+                text_content, title_text, description, links, images = \
+                    _extract_with_soup(response.content)
+
             return {
                 'success': True,
                 'url': url,
@@ -90,45 +244,88 @@ class WebCrawler:
                 'method': 'requests'
             }
     
-    def crawl_with_selenium(self, url: str, wait_time: int = 10) -> Dict[str, Any]:
-        """Crawl website using Selenium for JavaScript-heavy sites."""
-        driver = None
+    async def _crawl_one_async(self, session, url: str, semaphore) -> Dict[str, Any]:
+        """Fetch and parse a single URL on a shared aiohttp session."""
         try:
-            driver = self.setup_selenium_driver()
-            driver.get(url)
-            
-            # Wait for page to load
-            time.sleep(wait_time)
-            
-            # Wait for body to be present
-            WebDriverWait(driver, 20).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            
-            # Get page source after JavaScript execution
-            page_source = driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
-            
-            # Extract text content
-            text_content = soup.get_text(separator=' ', strip=True)
-            
-            # Extract title
-            title = soup.find('title')
-            title_text = title.get_text() if title else "No title found"
-            
-            # Extract meta description
-            meta_desc = soup.find('meta', attrs={'name': 'description'})
-            description = meta_desc.get('content') if meta_desc else "No description found"
-            
-            # Extract links
-            links = [a.get('href') for a in soup.find_all('a', href=True)]
-            
-            # Extract images
-            images = [img.get('src') for img in soup.find_all('img', src=True)]
-            
-            # Get current URL (in case of redirects)
-            current_url = driver.current_url
-            
+            async with semaphore:
+                async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                    response.raise_for_status()
+                    status_code = response.status
+                    content = await response.read()
+
+            if self.use_fast_parser:
+                text_content, title_text, description, links, images = \
+                    _extract_with_selectolax(content)
+            else:
+                text_content, title_text, description, links, images = \
+                    _extract_with_soup(content)
+
+            return {
+                'success': True,
+                'url': url,
+                'title': title_text,
+                'description': description,
+                'text_content': text_content[:5000],  # Limit text content
+                'links': links[:50],  # Limit links
+                'images': images[:20],  # Limit images
+                'status_code': status_code,
+                'method': 'aiohttp'
+            }
+
+        except Exception as e:
+            return {
+                'success': False,
+                'url': url,
+                'error': str(e),
+                'method': 'aiohttp'
+            }
+
+    async def crawl_many_async(self, urls, max_concurrency: int = 10):
+        """Crawl many URLs concurrently over one keep-alive connection pool.
+
+        Handshakes (DNS/TCP/TLS) are amortized across fetches instead of
+        paid per blocking GET; results come back in input order.
+        """
+        if aiohttp is None:
+            raise RuntimeError("aiohttp is required for crawl_many_async")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        connector = aiohttp.TCPConnector(
+            limit=max_concurrency, limit_per_host=4, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(
+                connector=connector, headers=dict(self.session.headers)) as session:
+            return await asyncio.gather(
+                *(self._crawl_one_async(session, url, semaphore) for url in urls))
+
+    def crawl_with_selenium(self, url: str, wait_time: int = 10,
+                            ready_selector: Optional[str] = None) -> Dict[str, Any]:
+        """Crawl website using Selenium for JavaScript-heavy sites.
+
+        Waits for the document to actually finish loading (and optionally
+        for `ready_selector` to appear) instead of sleeping a fixed
+        `wait_time`, so fast pages return as soon as they are ready.
+        """
+        try:
+            with self._driver_lock:
+                driver = self._get_selenium_driver()
+                driver.delete_all_cookies()
+                driver.get(url)
+
+                # Wait for the page to finish loading
+                self._wait_until_ready(driver, max(wait_time, 20), ready_selector)
+
+                # Get page source after JavaScript execution, then release
+                # the lock so parsing doesn't block other callers
+                page_source = driver.page_source
+                # Get current URL (in case of redirects)
+                current_url = driver.current_url
+            if self.use_fast_parser:
+                text_content, title_text, description, links, images = \
+                    _extract_with_selectolax(page_source)
+            else:
+                text_content, title_text, description, links, images = \
+                    _extract_with_soup(page_source)
+
             return {
                 'success': True,
                 'url': url,
@@ -142,16 +339,15 @@ class WebCrawler:
             }
             
         except Exception as e:
+            # Drop the shared driver so a wedged browser is not reused
+            self.close()
             return {
                 'success': False,
                 'url': url,
                 'error': str(e),
                 'method': 'selenium'
             }
-        finally:
-            if driver:
-                driver.quit()
-    
+
     def crawl_website(self, url: str, use_selenium: bool = False) -> Dict[str, Any]:
         """Main method to crawl a website."""
         if not url.startswith(('http://', 'https://')):
@@ -166,25 +362,52 @@ class WebCrawler:
         # Use Selenium for JavaScript-heavy sites or if requests failed
         return self.crawl_with_selenium(url)
     
-    def extract_specific_content(self, url: str, selectors: Dict[str, str]) -> Dict[str, Any]:
+    def crawl_many(self, urls, max_workers: int = 32) -> List[Dict[str, Any]]:
+        """Crawl many URLs in parallel with the requests path.
+
+        Fetches are I/O-bound (the GIL is released while blocked on the
+        socket), so a thread pool overlaps network latency across URLs;
+        the session's pooled adapter handles the concurrent connections.
+        Results come back in input order.
+        """
+        urls = list(urls)
+        if not urls:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+            return list(executor.map(self.crawl_with_requests, urls))
+
+    def extract_specific_content(self, url: str, selectors: Dict[str, str],
+                                 ready_selector: Optional[str] = None) -> Dict[str, Any]:
         """Extract specific content using CSS selectors."""
-        driver = None
         try:
-            driver = self.setup_selenium_driver()
-            driver.get(url)
-            time.sleep(5)
-            
+            with self._driver_lock:
+                driver = self._get_selenium_driver()
+                driver.delete_all_cookies()
+                driver.get(url)
+                self._wait_until_ready(driver, 20, ready_selector)
+
+                # Pull the rendered source once and run the selectors
+                # through the fast C parser locally instead of paying a
+                # webdriver protocol round-trip per selector
+                page_source = driver.page_source
             extracted_data = {}
-            for key, selector in selectors.items():
-                try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        extracted_data[key] = [elem.text for elem in elements]
-                    else:
-                        extracted_data[key] = []
-                except Exception as e:
-                    extracted_data[key] = f"Error extracting {key}: {str(e)}"
-            
+            if self.use_fast_parser:
+                tree = HTMLParser(page_source)
+                for key, selector in selectors.items():
+                    try:
+                        extracted_data[key] = [node.text(strip=True)
+                                               for node in tree.css(selector)]
+                    except Exception as e:
+                        extracted_data[key] = f"Error extracting {key}: {str(e)}"
+            else:
+                soup = BeautifulSoup(page_source, _SOUP_PARSER)
+                for key, selector in selectors.items():
+                    try:
+                        extracted_data[key] = [el.get_text(strip=True)
+                                               for el in soup.select(selector)]
+                    except Exception as e:
+                        extracted_data[key] = f"Error extracting {key}: {str(e)}"
+
             return {
                 'success': True,
                 'url': url,
@@ -192,14 +415,12 @@ class WebCrawler:
             }
             
         except Exception as e:
+            self.close()
             return {
                 'success': False,
                 'url': url,
                 'error': str(e)
             }
-        finally:
-            if driver:
-                driver.quit()
 
 
 # Example usage and testing
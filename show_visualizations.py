@@ -4,18 +4,27 @@ Show Visualizations Demo Script
 Demonstrates the visualizations available in the AI Web Crawler API
 """
 
+import asyncio
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
 import webbrowser
 from pathlib import Path
 
+# One pooled session for all probes so repeated localhost calls reuse the
+# same connection; short timeouts so a down server fails fast instead of
+# hanging the demo
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=4))
+PROBE_TIMEOUT = (1, 5)  # (connect, read) seconds
+
 def test_dashboard():
     """Test the dashboard endpoint."""
     print("🌐 Testing Dashboard Endpoint...")
-    
+
     try:
-        response = requests.get('http://localhost:8080/dashboard')
+        response = SESSION.get('http://localhost:8080/dashboard', timeout=PROBE_TIMEOUT)
         if response.status_code == 200:
             print("✅ Dashboard is accessible!")
             return True
@@ -25,6 +34,9 @@ def test_dashboard():
     except requests.exceptions.ConnectionError:
         print("❌ Cannot connect to server. Make sure the server is running.")
         return False
+    except requests.exceptions.Timeout:
+        print("❌ Server did not respond within 5 seconds.")
+        return False
 
 def test_visualize_endpoint():
     """Test the visualize endpoint with sample data."""
@@ -72,12 +84,13 @@ def test_visualize_endpoint():
     }
     
     try:
-        response = requests.post(
+        response = SESSION.post(
             'http://localhost:8080/visualize',
             json=sample_data,
-            headers={'Content-Type': 'application/json'}
+            headers={'Content-Type': 'application/json'},
+            timeout=PROBE_TIMEOUT
         )
-        
+
         if response.status_code == 200:
             result = response.json()
             print("✅ Visualization endpoint working!")
@@ -90,6 +103,9 @@ def test_visualize_endpoint():
     except requests.exceptions.ConnectionError:
         print("❌ Cannot connect to server.")
         return False
+    except requests.exceptions.Timeout:
+        print("❌ Visualization request timed out.")
+        return False
 
 def open_dashboard():
     """Open the dashboard in the default browser."""
@@ -115,25 +131,38 @@ def show_available_endpoints():
     print("   /smart-filter-crawl - Smart content filtering")
     print("   /visualize          - Generate data visualizations")
 
+def _run_probes():
+    """Probe the dashboard and visualize endpoints concurrently.
+
+    Both probes are independent, so overlapping them on worker threads
+    (the pooled session handles the two connections) roughly halves the
+    total probe time.
+    """
+    async def _gather():
+        return await asyncio.gather(
+            asyncio.to_thread(test_dashboard),
+            asyncio.to_thread(test_visualize_endpoint))
+    return asyncio.run(_gather())
+
 def main():
     """Main function to demonstrate visualizations."""
     print("🤖 AI Web Crawler - Visualization Demo")
     print("=" * 50)
-    
+
+    # Probe both endpoints at once
+    dashboard_ok, _ = _run_probes()
+
     # Check if server is running
-    if not test_dashboard():
+    if not dashboard_ok:
         print("\n💡 To start the server, run:")
         print("   cd /Users/ehabshobaki/Desktop/headless/crawler")
         print("   source venv/bin/activate")
         print("   python api.py")
         return
-    
+
     # Show available endpoints
     show_available_endpoints()
-    
-    # Test visualization endpoint
-    test_visualize_endpoint()
-    
+
     # Open dashboard
     open_dashboard()
     
@@ -333,126 +333,139 @@ class SmartContentFilter:
         return None
     
     def filter_content(self, pages: List[Dict[str, Any]], filter_config: ContentFilter) -> List[Dict[str, Any]]:
-        """Filter content based on the provided configuration."""
+        """Filter content based on the provided configuration.
+
+        Cheap scalar checks (word/link/image counts, URL patterns, keyword
+        presence) run first so pages they reject never pay for content-type
+        detection, quality scoring, or language analysis. Per-config work
+        (pattern compilation, keyword lowering) is hoisted out of the loop.
+        """
         filtered_pages = []
-        
+
+        url_patterns = ([re.compile(p, re.IGNORECASE) for p in filter_config.url_patterns]
+                        if filter_config.url_patterns else None)
+        exclude_url_patterns = ([re.compile(p, re.IGNORECASE) for p in filter_config.exclude_url_patterns]
+                                if filter_config.exclude_url_patterns else None)
+        # One combined pattern scans each document once however many
+        # keywords are configured, instead of a substring pass per keyword
+        keyword_re = (re.compile('|'.join(re.escape(k.lower()) for k in filter_config.keywords))
+                      if filter_config.keywords else None)
+        exclude_keyword_re = (re.compile('|'.join(re.escape(k.lower()) for k in filter_config.exclude_keywords))
+                              if filter_config.exclude_keywords else None)
+
         for page in pages:
             # Skip if page doesn't exist or failed
             if not page.get('success', False):
                 continue
-            
+
             url = page.get('url', '')
             title = page.get('title', '')
             text_content = page.get('text_content', '')
             detailed_text = page.get('detailed_text', {})
             word_count = page.get('word_count', 0)
-            
-            # Apply filters
-            
-            # 1. Content type filter
-            if filter_config.content_types:
-                detected_type = self.detect_content_type(url, title, text_content, detailed_text.get('meta_data', {}))
-                if detected_type not in filter_config.content_types:
-                    continue
-            
-            # 2. Word count filter
+
+            # --- Cheap filters first ---
+
+            # 1. Word count filter
             if word_count < filter_config.min_word_count:
                 continue
             if filter_config.max_word_count and word_count > filter_config.max_word_count:
                 continue
-            
-            # 3. Quality filter
-            quality, quality_score = self.assess_content_quality(text_content, detailed_text)
-            if quality_score < filter_config.min_quality_score:
+
+            # 2. URL pattern filter
+            if url_patterns and not any(p.search(url) for p in url_patterns):
                 continue
-            
-            # 4. Date range filter
-            if filter_config.date_range:
-                content_date = self.extract_date(text_content, detailed_text.get('meta_data', {}))
-                if content_date:
-                    start_date, end_date = filter_config.date_range
-                    if not (start_date <= content_date <= end_date):
-                        continue
-            
-            # 5. Keyword filter
-            if filter_config.keywords:
-                text_lower = text_content.lower()
-                if not any(keyword.lower() in text_lower for keyword in filter_config.keywords):
-                    continue
-            
-            # 6. Exclude keywords filter
-            if filter_config.exclude_keywords:
-                text_lower = text_content.lower()
-                if any(keyword.lower() in text_lower for keyword in filter_config.exclude_keywords):
-                    continue
-            
-            # 7. URL pattern filter
-            if filter_config.url_patterns:
-                if not any(re.search(pattern, url, re.IGNORECASE) for pattern in filter_config.url_patterns):
-                    continue
-            
-            # 8. Exclude URL pattern filter
-            if filter_config.exclude_url_patterns:
-                if any(re.search(pattern, url, re.IGNORECASE) for pattern in filter_config.exclude_url_patterns):
-                    continue
-            
-            # 9. Links filter
+
+            # 3. Exclude URL pattern filter
+            if exclude_url_patterns and any(p.search(url) for p in exclude_url_patterns):
+                continue
+
+            # 4. Links filter
             links_count = len(detailed_text.get('links', []))
             if links_count < filter_config.min_links:
                 continue
             if filter_config.max_links and links_count > filter_config.max_links:
                 continue
-            
-            # 10. Images filter
+
+            # 5. Images filter
             images_count = len(detailed_text.get('images', []))
             if images_count < filter_config.min_images:
                 continue
             if filter_config.max_images and images_count > filter_config.max_images:
                 continue
-            
-            # 11. Language filter
-            if filter_config.language:
-                detected_language = self.detect_language(text_content)
-                if detected_language != filter_config.language:
+
+            text_lower = text_content.lower()
+
+            # 6. Keyword filter
+            if keyword_re and not keyword_re.search(text_lower):
+                continue
+
+            # 7. Exclude keywords filter
+            if exclude_keyword_re and exclude_keyword_re.search(text_lower):
+                continue
+
+            # --- Expensive analyses on the surviving pages ---
+
+            # 8. Content type filter
+            detected_type = self.detect_content_type(url, title, text_content, detailed_text.get('meta_data', {}))
+            if filter_config.content_types and detected_type not in filter_config.content_types:
+                continue
+
+            # 9. Quality filter
+            quality, quality_score = self.assess_content_quality(text_content, detailed_text)
+            if quality_score < filter_config.min_quality_score:
+                continue
+
+            # 10. Date range filter
+            content_date = self.extract_date(text_content, detailed_text.get('meta_data', {}))
+            if filter_config.date_range and content_date:
+                start_date, end_date = filter_config.date_range
+                if not (start_date <= content_date <= end_date):
                     continue
-            
+
+            # 11. Language filter
+            detected_language = self.detect_language(text_content)
+            if filter_config.language and detected_language != filter_config.language:
+                continue
+
             # 12. Sentiment filter
             if filter_config.sentiment:
                 # Simple sentiment detection
                 positive_words = ['good', 'great', 'excellent', 'amazing', 'wonderful']
                 negative_words = ['bad', 'terrible', 'awful', 'horrible', 'worst']
-                
-                text_lower = text_content.lower()
+
                 positive_count = sum(1 for word in positive_words if word in text_lower)
                 negative_count = sum(1 for word in negative_words if word in text_lower)
-                
+
                 if positive_count > negative_count:
                     detected_sentiment = 'positive'
                 elif negative_count > positive_count:
                     detected_sentiment = 'negative'
                 else:
                     detected_sentiment = 'neutral'
-                
+
                 if detected_sentiment != filter_config.sentiment:
                     continue
-            
+
             # 13. Duplicate filter
-            if filter_config.duplicate_threshold:
-                if self.is_duplicate(text_content, filter_config.duplicate_threshold):
-                    continue
-            
-            # Add analysis data to the page
+            is_duplicate = (self.is_duplicate(text_content, filter_config.duplicate_threshold)
+                            if filter_config.duplicate_threshold else False)
+            if is_duplicate:
+                continue
+
+            # Add analysis data to the page, reusing the values computed
+            # during filtering instead of re-running the detectors
             page['content_analysis'] = {
-                'content_type': self.detect_content_type(url, title, text_content, detailed_text.get('meta_data', {})).value,
+                'content_type': detected_type.value,
                 'quality': quality.value,
                 'quality_score': quality_score,
-                'language': self.detect_language(text_content),
-                'date_extracted': self.extract_date(text_content, detailed_text.get('meta_data', {})),
-                'is_duplicate': self.is_duplicate(text_content, filter_config.duplicate_threshold)
+                'language': detected_language,
+                'date_extracted': content_date,
+                'is_duplicate': is_duplicate
             }
-            
+
             filtered_pages.append(page)
-        
+
         return filtered_pages
     
     def categorize_content(self, pages: List[Dict[str, Any]]) -> Dict[ContentType, List[Dict[str, Any]]]: